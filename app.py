@@ -203,27 +203,66 @@ def fetch_transcript(video_id: str) -> str:
     except Exception as e:
         st.error(f"Error fetching transcript for video {video_id}: {e}")
         return None
+def stream_generated_text(model, prompt: str, placeholder, start_time: float):
+    """
+    Stream a Gemini response into a Streamlit placeholder as chunks arrive.
+    Returns the full text and the time (in seconds since start_time) of the first chunk.
+    """
+    response = model.generate_content(prompt, stream=True)
+    text = ""
+    first_content_time = None
+    for chunk in response:
+        try:
+            chunk_text = chunk.text
+        except ValueError:
+            continue  # Chunk has no text parts (e.g. blocked or empty candidate)
+        if not chunk_text:
+            continue
+        if first_content_time is None:
+            first_content_time = time.perf_counter() - start_time
+        text += chunk_text
+        if placeholder is not None:
+            placeholder.markdown(text)
+    return text, first_content_time
+
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-def generate_questions_and_summary(transcript: str) -> dict:
+def generate_questions_and_summary(transcript: str, stream: bool = False,
+                                   summary_placeholder=None, qa_placeholder=None) -> dict:
     """
     Generate a summary, questions, and answers using the Gemini API.
+    When stream is True, tokens are rendered progressively into the given placeholders.
+    Also reports time to first content and total latency (in seconds).
     """
     try:
         model = genai.GenerativeModel('gemini-pro')
+        start_time = time.perf_counter()
         
-        # Generate summary
         summary_prompt = f"Summarize the following transcript in 100 words:\n{transcript}"
-        summary_response = model.generate_content(summary_prompt)
-        summary = summary_response.text if summary_response else "Summary generation failed"
-        
-        # Generate questions and answers
         qa_prompt = f"Generate 3 questions and answers based on the following transcript:\n{transcript}"
-        qa_response = model.generate_content(qa_prompt)
-        qa = qa_response.text if qa_response else "Q&A generation failed"
+        
+        if stream:
+            # Stream summary, then questions and answers
+            summary, first_content_time = stream_generated_text(model, summary_prompt, summary_placeholder, start_time)
+            qa, qa_first_content_time = stream_generated_text(model, qa_prompt, qa_placeholder, start_time)
+            if first_content_time is None:
+                first_content_time = qa_first_content_time
+            summary = summary or "Summary generation failed"
+            qa = qa or "Q&A generation failed"
+        else:
+            # Generate summary
+            summary_response = model.generate_content(summary_prompt)
+            summary = summary_response.text if summary_response else "Summary generation failed"
+            first_content_time = time.perf_counter() - start_time
+            
+            # Generate questions and answers
+            qa_response = model.generate_content(qa_prompt)
+            qa = qa_response.text if qa_response else "Q&A generation failed"
         
         return {
             "summary": summary,
-            "qa": qa
+            "qa": qa,
+            "time_to_first_content": first_content_time,
+            "total_latency": time.perf_counter() - start_time
         }
     except Exception as e:
         st.error(f"Error generating questions and summary: {e}")
@@ -622,19 +661,38 @@ if st.session_state.user:
         st.header("Daily PDF Generation")
         if st.session_state.saved_schedule:
             current_day = calculate_current_day()
+            stream_output = st.checkbox("Show summaries and Q&A as they are generated", value=True)
             if st.button("Generate Today's PDF"):
                 day_videos = st.session_state.saved_schedule.get(current_day, [])
                 if day_videos:
                     # Fetch transcripts and generate summaries/Q&A
                     transcripts_data = []
-                    for video in day_videos:
+                    for idx, video in enumerate(day_videos, 1):
                         # Extract video ID from URL
                         video_id = extract_video_id(video['url'])
                         transcript = fetch_transcript(video_id) or "Transcript not available"
                         
                         if transcript:
-                            # Generate summary and Q&A
-                            generated_data = generate_questions_and_summary(transcript)
+                            # Generate summary and Q&A, streaming into the page if enabled
+                            summary_placeholder = qa_placeholder = None
+                            if stream_output:
+                                st.subheader(f"Video {idx}: {video['title']}")
+                                st.markdown("**Summary:**")
+                                summary_placeholder = st.empty()
+                                st.markdown("**Questions & Answers:**")
+                                qa_placeholder = st.empty()
+                            generated_data = generate_questions_and_summary(
+                                transcript,
+                                stream=stream_output,
+                                summary_placeholder=summary_placeholder,
+                                qa_placeholder=qa_placeholder
+                            )
+                            first_content_time = generated_data["time_to_first_content"]
+                            first_content_str = f"{first_content_time:.2f}s" if first_content_time is not None else "n/a"
+                            st.caption(
+                                f"Video {idx}: time to first content {first_content_str}, "
+                                f"total latency {generated_data['total_latency']:.2f}s"
+                            )
                             transcripts_data.append({
                                 "transcript": transcript,
                                 "summary": generated_data["summary"],